@@ -3,15 +3,39 @@ Export formats module for QuickTARA
 Handles export to JSON, Excel, and PDF formats
 """
 
+import dataclasses
 import json
+from enum import Enum
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Iterable
 import pandas as pd
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+def _json_default(obj: Any) -> Any:
+    """Encode dataclasses and enums for json.dump the way orjson does natively"""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def export_to_json(data: Dict, output_file: Path) -> None:
-    """Export report data to JSON format"""
+    """Export report data to JSON format
+    
+    Both encoders turn dataclasses (e.g. compliance requirements) into
+    objects and enums into their values, with the same indented layout.
+    """
+    if HAS_ORJSON:
+        output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with output_file.open('w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
 
 def export_to_excel(data: Dict, output_file: Path) -> None:
     """Export report data to Excel format with multiple sheets"""
@@ -141,98 +165,102 @@ def export_to_excel(data: Dict, output_file: Path) -> None:
 
 def export_to_text(data: Dict, output_file: Path) -> None:
     """Export report data to plain text format"""
-    with output_file.open('w', encoding='utf-8') as f:
-        # Report header
-        f.write("==== QuickTARA Security Analysis Report ====\n\n")
-        f.write(f"Generated: {data.get('generated_at', '')}\n\n")
-        
-        # Summary section
-        summary = data.get('summary', {})
-        f.write("=== Summary ===\n")
-        f.write(f"Total Components: {summary.get('total_components', 0)}\n")
-        f.write(f"Total Threats: {summary.get('total_threats', 0)}\n")
-        f.write(f"Critical Components: {summary.get('critical_components', 0)}\n")
-        f.write(f"High Risk Threats: {summary.get('high_risk_threats', 0)}\n\n")
+    parts = []
+    write = parts.append
+    
+    # Report header
+    write("==== QuickTARA Security Analysis Report ====\n\n")
+    write(f"Generated: {data.get('generated_at', '')}\n\n")
+    
+    # Summary section
+    summary = data.get('summary', {})
+    write("=== Summary ===\n")
+    write(f"Total Components: {summary.get('total_components', 0)}\n")
+    write(f"Total Threats: {summary.get('total_threats', 0)}\n")
+    write(f"Critical Components: {summary.get('critical_components', 0)}\n")
+    write(f"High Risk Threats: {summary.get('high_risk_threats', 0)}\n\n")
+    
+    # Components section
+    write("=== Components ===\n\n")
+    for comp_id, comp in data.get('components', {}).items():
+        if not isinstance(comp, dict):
+            continue
+            
+        write(f"Component: {comp_id} - {comp.get('name', '')}\n")
+        write(f"Type: {comp.get('type', 'Unknown')}\n")
+        write(f"Safety Level: {comp.get('safety_level', 'Unknown')}\n")
+        write(f"Interfaces: {', '.join(comp.get('interfaces', []))}\n")
+        write(f"Access Points: {', '.join(comp.get('access_points', []))}\n")
+        write(f"Data Types: {', '.join(comp.get('data_types', []))}\n")
+        write(f"Location: {comp.get('location', 'Unknown')}\n")
+        write(f"Trust Zone: {comp.get('trust_zone', 'Unknown')}\n")
+        write(f"Connected To: {', '.join(comp.get('connected_to', []))}\n\n")
         
-        # Components section
-        f.write("=== Components ===\n\n")
-        for comp_id, comp in data.get('components', {}).items():
-            if not isinstance(comp, dict):
-                continue
-                
-            f.write(f"Component: {comp_id} - {comp.get('name', '')}\n")
-            f.write(f"Type: {comp.get('type', 'Unknown')}\n")
-            f.write(f"Safety Level: {comp.get('safety_level', 'Unknown')}\n")
-            f.write(f"Interfaces: {', '.join(comp.get('interfaces', []))}\n")
-            f.write(f"Access Points: {', '.join(comp.get('access_points', []))}\n")
-            f.write(f"Data Types: {', '.join(comp.get('data_types', []))}\n")
-            f.write(f"Location: {comp.get('location', 'Unknown')}\n")
-            f.write(f"Trust Zone: {comp.get('trust_zone', 'Unknown')}\n")
-            f.write(f"Connected To: {', '.join(comp.get('connected_to', []))}\n\n")
+        # Threats
+        write("  Threats:\n")
+        for threat in comp.get('threats', []):
+            write(f"  - {threat.get('name', '')}\n")
+            write(f"    Description: {threat.get('description', '')[:100]}...\n")
+            write(f"    Likelihood: {threat.get('likelihood', 0)}\n")
+            
+            # Impact
+            impact = threat.get('impact', {})
+            write("    Impact:\n")
+            for category, score in impact.items():
+                write(f"      {category}: {score}\n")
+            
+            # Risk factors
+            risk_factors = threat.get('risk_factors', {})
+            write("    Risk Factors:\n")
+            for factor, value in risk_factors.items():
+                write(f"      {factor}: {value:.2f}\n")
             
-            # Threats
-            f.write("  Threats:\n")
-            for threat in comp.get('threats', []):
-                f.write(f"  - {threat.get('name', '')}\n")
-                f.write(f"    Description: {threat.get('description', '')[:100]}...\n")
-                f.write(f"    Likelihood: {threat.get('likelihood', 0)}\n")
+            write("\n")
+        
+        # STRIDE Analysis
+        if 'stride_analysis' in comp:
+            write("  STRIDE Analysis:\n")
+            for category, details in comp.get('stride_analysis', {}).items():
+                write(f"  - {category}: {details.get('risk_level', 'Low')}\n")
+                if 'recommendations' in details:
+                    write("    Recommendations:\n")
+                    for rec in details.get('recommendations', []):
+                        write(f"      * {rec}\n")
+            write("\n")
+        
+        # Attack Paths
+        if 'attack_paths' in comp:
+            write("  Attack Paths:\n")
+            for path_info in comp.get('attack_paths', []):
+                path = path_info.get('path', [])
+                risk = path_info.get('risk', {})
                 
-                # Impact
-                impact = threat.get('impact', {})
-                f.write("    Impact:\n")
-                for category, score in impact.items():
-                    f.write(f"      {category}: {score}\n")
+                write(f"  - Path: {' -> '.join(path)}\n")
+                write("    Risk Scores:\n")
+                for category, score in risk.items():
+                    write(f"      {category}: {score}\n")
+            write("\n")
+        
+        # Risk Acceptance
+        if 'risk_acceptance' in comp:
+            write("  Risk Acceptance:\n")
+            for threat_name, assessment in comp.get('risk_acceptance', {}).items():
+                write(f"  - Threat: {threat_name}\n")
+                write(f"    Severity: {assessment.get('risk_severity', 'Medium')}\n")
+                write(f"    Decision: {assessment.get('decision', 'Mitigate')}\n")
+                write(f"    Residual Risk: {assessment.get('residual_risk', 0.5):.1%}\n")
+                write(f"    Justification: {assessment.get('justification', '')}\n")
                 
-                # Risk factors
-                risk_factors = threat.get('risk_factors', {})
-                f.write("    Risk Factors:\n")
-                for factor, value in risk_factors.items():
-                    f.write(f"      {factor}: {value:.2f}\n")
+                if 'conditions' in assessment:
+                    write("    Conditions:\n")
+                    for condition in assessment.get('conditions', []):
+                        write(f"      * {condition}\n")
                 
-                f.write("\n")
-            
-            # STRIDE Analysis
-            if 'stride_analysis' in comp:
-                f.write("  STRIDE Analysis:\n")
-                for category, details in comp.get('stride_analysis', {}).items():
-                    f.write(f"  - {category}: {details.get('risk_level', 'Low')}\n")
-                    if 'recommendations' in details:
-                        f.write("    Recommendations:\n")
-                        for rec in details.get('recommendations', []):
-                            f.write(f"      * {rec}\n")
-                f.write("\n")
-            
-            # Attack Paths
-            if 'attack_paths' in comp:
-                f.write("  Attack Paths:\n")
-                for path_info in comp.get('attack_paths', []):
-                    path = path_info.get('path', [])
-                    risk = path_info.get('risk', {})
-                    
-                    f.write(f"  - Path: {' -> '.join(path)}\n")
-                    f.write("    Risk Scores:\n")
-                    for category, score in risk.items():
-                        f.write(f"      {category}: {score}\n")
-                f.write("\n")
-            
-            # Risk Acceptance
-            if 'risk_acceptance' in comp:
-                f.write("  Risk Acceptance:\n")
-                for threat_name, assessment in comp.get('risk_acceptance', {}).items():
-                    f.write(f"  - Threat: {threat_name}\n")
-                    f.write(f"    Severity: {assessment.get('risk_severity', 'Medium')}\n")
-                    f.write(f"    Decision: {assessment.get('decision', 'Mitigate')}\n")
-                    f.write(f"    Residual Risk: {assessment.get('residual_risk', 0.5):.1%}\n")
-                    f.write(f"    Justification: {assessment.get('justification', '')}\n")
-                    
-                    if 'conditions' in assessment:
-                        f.write("    Conditions:\n")
-                        for condition in assessment.get('conditions', []):
-                            f.write(f"      * {condition}\n")
-                    
-                    f.write("\n")
-            
-            f.write("\n")
+                write("\n")
+        
+        write("\n")
+    
+    output_file.write_text(''.join(parts), encoding='utf-8')
 
 def export_report(data: Dict, output_path: Path, format: str = 'txt') -> None:
     """Export report data to specified format"""
@@ -250,3 +278,8 @@ def export_report(data: Dict, output_path: Path, format: str = 'txt') -> None:
             export_to_text(data, output_path.with_suffix('.txt'))
     else:  # Default to text
         export_to_text(data, output_path.with_suffix('.txt'))
+
+def export_report_multi(data: Dict, output_path: Path, formats: Iterable[str]) -> None:
+    """Export one prepared report to several formats, skipping repeated formats"""
+    for format in dict.fromkeys(formats):
+        export_report(data, output_path, format)
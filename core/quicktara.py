@@ -4,18 +4,30 @@ QuickTARA - Lightweight Automotive Risk Assessor
 Enhanced with detailed component analysis and STRIDE
 """
 
-import csv
+import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Callable, Iterable, List, Dict, Optional, Sequence, Set, Tuple, Union
 from collections import defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from datetime import datetime
 import json
 
+import numpy as np
+import pandas as pd
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    HAS_AHOCORASICK = False
+
 from core.compliance_mappings import map_threat_to_standards, format_compliance_mappings
-from core.export_formats import export_report
+from core.export_formats import export_report_multi
 from core.stride_analysis import (
     analyze_stride_categories,
     get_stride_recommendations,
@@ -28,7 +40,7 @@ from core.risk_acceptance import (
     RiskAcceptanceAssessment
 )
 from core.threat_analysis import (
-    load_threats_from_capec,
+    load_threats_from_capec_cached,
     AUTOMOTIVE_THREATS,
     analyze_impact_categories,
     ImpactScore
@@ -56,80 +68,187 @@ class TrustZone(Enum):
     STANDARD = "Standard"
     UNTRUSTED = "Untrusted"
 
-@dataclass
+@dataclass(frozen=True)
 class Component:
+    # Declared by hand because dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        'component_id', 'name', 'type', 'safety_level', 'interfaces',
+        'access_points', 'data_types', 'location', 'trust_zone', 'connected_to'
+    )
+    
     component_id: str
     name: str
     type: AssetType
     safety_level: SafetyLevel
-    interfaces: Set[str]
-    access_points: Set[str]
-    data_types: Set[str]
+    interfaces: Tuple[str, ...]
+    access_points: Tuple[str, ...]
+    data_types: Tuple[str, ...]
     location: str
     trust_zone: TrustZone
-    connected_to: Set[str]
+    connected_to: Tuple[str, ...]
+    
+    def __reduce__(self):
+        # Frozen instances cannot be restored slot by slot with setattr
+        return (Component, tuple(getattr(self, name) for name in self.__slots__))
+
+@lru_cache(maxsize=4096)
+def _split_multi_value(value: str) -> Tuple[str, ...]:
+    """Split a pipe-separated CSV cell into unique, non-empty values in order
+    
+    Cached so components with identical cells share one tuple of interned strings.
+    """
+    return tuple(dict.fromkeys(map(sys.intern, filter(None, (v.strip() for v in value.split('|'))))))
+
+COMPONENT_COLUMNS = (
+    'component_id', 'name', 'type', 'safety_level', 'interfaces',
+    'access_points', 'data_types', 'location', 'trust_zone', 'connected_to'
+)
+
+# Cell resolvers shared by parse_component and load_components: one
+# member lookup each, None when the cleaned value is not valid
+def _resolve_asset_type(value: str) -> Optional[AssetType]:
+    return AssetType.__members__.get(value.strip().upper())
+
+def _resolve_safety_level(value: str) -> Optional[SafetyLevel]:
+    return SafetyLevel.__members__.get(value.strip().upper().replace(' ', '_'))
+
+def _resolve_trust_zone(value: str) -> Optional[TrustZone]:
+    return TrustZone.__members__.get(value.strip().upper())
+
+def _resolve_location(value: str) -> Optional[str]:
+    location = value.strip()
+    return sys.intern(location) if location in ('Internal', 'External') else None
 
 def parse_component(row: Dict[str, str]) -> Component:
     """Parse a CSV row into a Component object"""
     try:
+        component_type = row['type']
+        safety_level = row['safety_level']
+        trust_zone = row['trust_zone']
+        location = row['location']
+        
         # Clean and validate type
-        component_type = row['type'].strip().upper()
-        if component_type not in AssetType.__members__:
-            raise ValueError(f"Invalid component type: {component_type}")
+        asset_type = _resolve_asset_type(component_type)
+        if asset_type is None:
+            raise ValueError(f"Invalid component type: {component_type.strip().upper()}")
         
         # Clean and validate safety level
-        safety_level = row['safety_level'].strip().upper().replace(' ', '_')
-        if safety_level not in SafetyLevel.__members__:
-            raise ValueError(f"Invalid safety level: {safety_level}")
+        level = _resolve_safety_level(safety_level)
+        if level is None:
+            raise ValueError(f"Invalid safety level: {safety_level.strip().upper().replace(' ', '_')}")
         
         # Clean and validate trust zone
-        trust_zone = row['trust_zone'].strip().upper()
-        if trust_zone not in TrustZone.__members__:
-            raise ValueError(f"Invalid trust zone: {trust_zone}")
+        zone = _resolve_trust_zone(trust_zone)
+        if zone is None:
+            raise ValueError(f"Invalid trust zone: {trust_zone.strip().upper()}")
         
         # Clean and validate location
-        location = row['location'].strip()
-        if location not in ('Internal', 'External'):
-            raise ValueError(f"Invalid location: {location}")
+        resolved_location = _resolve_location(location)
+        if resolved_location is None:
+            raise ValueError(f"Invalid location: {location.strip()}")
         
         return Component(
             component_id=row['component_id'].strip(),
             name=row['name'].strip(),
-            type=AssetType[component_type],
-            safety_level=SafetyLevel[safety_level],
-            interfaces=set(filter(None, (i.strip() for i in row['interfaces'].split('|')))),
-            access_points=set(filter(None, (a.strip() for a in row['access_points'].split('|')))),
-            data_types=set(filter(None, (d.strip() for d in row['data_types'].split('|')))),
-            location=location,
-            trust_zone=TrustZone[trust_zone],
-            connected_to=set(filter(None, (c.strip() for c in row['connected_to'].split('|'))))
+            type=asset_type,
+            safety_level=level,
+            interfaces=_split_multi_value(row['interfaces']),
+            access_points=_split_multi_value(row['access_points']),
+            data_types=_split_multi_value(row['data_types']),
+            location=resolved_location,
+            trust_zone=zone,
+            connected_to=_split_multi_value(row['connected_to'])
         )
     except (KeyError, ValueError) as e:
         raise ValueError(f"Invalid component data: {e}")
 
+def _resolve_column(column: pd.Series, resolve: Callable[[str], object]) -> np.ndarray:
+    """Resolve each distinct cell of a column once and broadcast back to its rows"""
+    codes, uniques = pd.factorize(column)
+    resolved = np.empty(len(uniques), dtype=object)
+    for i, value in enumerate(uniques.tolist()):
+        resolved[i] = resolve(value)
+    return resolved[codes]
+
 def load_components(asset_file: Path) -> Dict[str, Component]:
-    """Load and parse components from enhanced CSV format"""
+    """Load and parse components from enhanced CSV format
+    
+    Columns are cleaned and validated per distinct value; rows that fail
+    validation go through parse_component to report why.
+    """
     components = {}
     try:
-        with asset_file.open() as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    component = parse_component(row)
-                    components[component.component_id] = component
-                except ValueError as e:
-                    print(f"Warning: Could not parse component {row.get('name', 'Unknown')}: {e}", file=sys.stderr)
-                    continue
-    except (csv.Error, IOError) as e:
+        # index_col=False keeps rows with a trailing comma (common in Excel
+        # exports) aligned with the header instead of shifting them
+        frame = pd.read_csv(asset_file, dtype=str, keep_default_na=False, index_col=False,
+                            usecols=lambda column: column in COMPONENT_COLUMNS)
+    except pd.errors.EmptyDataError:
+        frame = None
+    except (pd.errors.ParserError, IOError) as e:
         print(f"Error loading components: {e}", file=sys.stderr)
         raise ValueError(f"Error loading components: {e}")
     
+    if frame is not None:
+        missing = [column for column in COMPONENT_COLUMNS if column not in frame.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+        
+        component_types = _resolve_column(frame['type'], _resolve_asset_type)
+        safety_levels = _resolve_column(frame['safety_level'], _resolve_safety_level)
+        trust_zones = _resolve_column(frame['trust_zone'], _resolve_trust_zone)
+        locations = _resolve_column(frame['location'], _resolve_location)
+        valid = (
+            pd.notna(component_types) & pd.notna(safety_levels)
+            & pd.notna(trust_zones) & pd.notna(locations)
+        )
+        
+        for row in frame[~valid].to_dict('records'):
+            try:
+                parse_component(row)
+            except ValueError as e:
+                print(f"Warning: Could not parse component {row['name']}: {e}", file=sys.stderr)
+        
+        frame = frame[valid]
+        for fields in zip(
+            [v.strip() for v in frame['component_id'].tolist()],
+            [v.strip() for v in frame['name'].tolist()],
+            component_types[valid].tolist(),
+            safety_levels[valid].tolist(),
+            _resolve_column(frame['interfaces'], _split_multi_value).tolist(),
+            _resolve_column(frame['access_points'], _split_multi_value).tolist(),
+            _resolve_column(frame['data_types'], _split_multi_value).tolist(),
+            locations[valid].tolist(),
+            trust_zones[valid].tolist(),
+            _resolve_column(frame['connected_to'], _split_multi_value).tolist(),
+        ):
+            component = Component(*fields)
+            components[component.component_id] = component
+    
     if not components:
         print("Error: No valid components found in the CSV file", file=sys.stderr)
         raise ValueError("No valid components found in the CSV file")
     
     return components
 
+# Risk factor weights, shared by every component and threat adjustment
+EXPOSURE_SCORES = {
+    'External': 1.0,
+    'Internal': 0.6
+}
+TRUST_SCORES = {
+    TrustZone.UNTRUSTED: 1.0,
+    TrustZone.BOUNDARY: 0.8,
+    TrustZone.STANDARD: 0.6,
+    TrustZone.CRITICAL: 0.4
+}
+SAFETY_IMPACT_FACTORS = {
+    SafetyLevel.QM: 0.6,
+    SafetyLevel.ASIL_A: 0.8,
+    SafetyLevel.ASIL_B: 1.0,
+    SafetyLevel.ASIL_C: 1.2,
+    SafetyLevel.ASIL_D: 1.4
+}
+
 def calculate_component_risk_factors(component: Component) -> Dict[str, float]:
     """Calculate risk factors based on component attributes"""
     risk_factors = {
@@ -139,18 +258,8 @@ def calculate_component_risk_factors(component: Component) -> Dict[str, float]:
     }
     
     # Exposure based on location and trust zone
-    exposure_scores = {
-        'External': 1.0,
-        'Internal': 0.6
-    }
-    trust_scores = {
-        TrustZone.UNTRUSTED: 1.0,
-        TrustZone.BOUNDARY: 0.8,
-        TrustZone.STANDARD: 0.6,
-        TrustZone.CRITICAL: 0.4
-    }
-    risk_factors['exposure'] = (exposure_scores.get(component.location, 0.5) + 
-                              trust_scores.get(component.trust_zone, 0.5)) / 2
+    risk_factors['exposure'] = (EXPOSURE_SCORES.get(component.location, 0.5) + 
+                              TRUST_SCORES.get(component.trust_zone, 0.5)) / 2
 
     # Complexity based on interfaces and connections
     risk_factors['complexity'] = min(1.0, (
@@ -166,10 +275,9 @@ def calculate_component_risk_factors(component: Component) -> Dict[str, float]:
 
     return risk_factors
 
-def adjust_threat_scores(threat: Dict, component: Component) -> Dict:
-    """Adjust threat scores based on component characteristics"""
-    risk_factors = calculate_component_risk_factors(component)
-    
+def _adjusted_scores(threat: Dict, component: Component,
+                     risk_factors: Dict[str, float]) -> Tuple[float, Dict[str, float]]:
+    """Return the component-adjusted likelihood and impact for a threat"""
     # Adjust likelihood based on risk factors
     base_likelihood = threat['likelihood']
     exposure_factor = risk_factors['exposure']
@@ -183,202 +291,451 @@ def adjust_threat_scores(threat: Dict, component: Component) -> Dict:
     )))
     
     # Adjust impact based on safety level
-    safety_impact_factors = {
-        SafetyLevel.QM: 0.6,
-        SafetyLevel.ASIL_A: 0.8,
-        SafetyLevel.ASIL_B: 1.0,
-        SafetyLevel.ASIL_C: 1.2,
-        SafetyLevel.ASIL_D: 1.4
-    }
-    
-    safety_factor = safety_impact_factors.get(component.safety_level, 1.0)
+    safety_factor = SAFETY_IMPACT_FACTORS.get(component.safety_level, 1.0)
     adjusted_impact = {
         category: min(5, max(1, score * safety_factor))
         for category, score in threat['impact'].items()
     }
     
-    # Create adjusted threat
-    adjusted_threat = threat.copy()
-    adjusted_threat['likelihood'] = adjusted_likelihood
-    adjusted_threat['impact'] = adjusted_impact
-    adjusted_threat['risk_factors'] = risk_factors
+    return adjusted_likelihood, adjusted_impact
+
+def adjust_threat_scores(threat: Dict, component: Component,
+                         risk_factors: Optional[Dict[str, float]] = None) -> Dict:
+    """Adjust threat scores based on component characteristics"""
+    if risk_factors is None:
+        risk_factors = calculate_component_risk_factors(component)
     
-    return adjusted_threat
+    adjusted_likelihood, adjusted_impact = _adjusted_scores(threat, component, risk_factors)
+    return {
+        **threat,
+        'likelihood': adjusted_likelihood,
+        'impact': adjusted_impact,
+        'risk_factors': risk_factors
+    }
+
+# Matched threats per component from which scores are adjusted as arrays
+BATCH_SCORING_MIN = 8
+
+def _clip_scores(scores: np.ndarray) -> list:
+    """Clip scores to 1..5 as min(5, max(1, score)) does, clipped values as ints"""
+    clipped = scores.astype(object)
+    clipped[scores >= 5] = 5
+    clipped[scores <= 1] = 1
+    return clipped.tolist()
+
+def _matched_threats(matches: List[Tuple[str, Dict]], component: Component,
+                     risk_factors: Dict[str, float]) -> List[Dict]:
+    """Build the per-component threat entries, adjusting all scores at once
+    
+    Every match shares the component's risk factors and safety factor, so
+    likelihoods and impacts are scaled as arrays rather than per threat.
+    """
+    threats = [threat for _, threat in matches]
+    categories = tuple(threats[0]['impact']) if threats else ()
+    if len(threats) < BATCH_SCORING_MIN or any(tuple(threat['impact']) != categories for threat in threats):
+        # Array set-up costs more than it saves for a handful of threats
+        scores = [_adjusted_scores(threat, component, risk_factors) for threat in threats]
+        likelihoods = [likelihood for likelihood, _ in scores]
+        impacts = [impact for _, impact in scores]
+    else:
+        likelihood_factor = (
+            0.4 * risk_factors['exposure'] +
+            0.3 * risk_factors['attack_surface'] +
+            0.3
+        )
+        likelihoods = _clip_scores(
+            np.array([threat['likelihood'] for threat in threats], dtype=float) * likelihood_factor
+        )
+        safety_factor = SAFETY_IMPACT_FACTORS.get(component.safety_level, 1.0)
+        scores = np.array(
+            [list(threat['impact'].values()) for threat in threats], dtype=float
+        ).reshape(len(threats), len(categories))
+        impacts = [dict(zip(categories, row)) for row in _clip_scores(scores * safety_factor)]
+    
+    return [
+        {
+            'name': name,
+            **threat,
+            'likelihood': likelihood,
+            'impact': impact,
+            'risk_factors': risk_factors
+        }
+        for (name, threat), likelihood, impact in zip(matches, likelihoods, impacts)
+    ]
+
+# Distinct interface and data type tokens from which the index uses Aho-Corasick
+AHOCORASICK_MIN_TOKENS = 64
+
+@dataclass
+class ThreatIndex:
+    """Threat names keyed by the lowercased component tokens that match them"""
+    by_type: Dict[str, Set[str]]
+    by_text: Dict[str, Set[str]]
+    order: Dict[str, int]
+
+def build_threat_index(components: List[Component], threats: Dict[str, Dict]) -> ThreatIndex:
+    """Index threats by every component type, interface and data type in scope"""
+    type_tokens = {c.type.value.lower() for c in components}
+    text_tokens = {
+        token.lower()
+        for c in components
+        for token in (*c.interfaces, *c.data_types)
+    }
+    
+    # With many tokens, scan every description once for all of them; a
+    # handful of plain substring checks is faster than iterating matches
+    automaton = None
+    if HAS_AHOCORASICK and len(text_tokens) >= AHOCORASICK_MIN_TOKENS and '' not in text_tokens:
+        automaton = ahocorasick.Automaton()
+        for token in text_tokens:
+            automaton.add_word(token, token)
+        automaton.make_automaton()
+    
+    by_type = defaultdict(set)
+    by_text = defaultdict(set)
+    for name, threat in threats.items():
+        name_lower = name.lower()
+        description = threat.get('description', '').lower()
+        for token in type_tokens:
+            if token in name_lower:
+                by_type[token].add(name)
+        if automaton is not None:
+            for _, token in automaton.iter(description):
+                by_text[token].add(name)
+        else:
+            for token in text_tokens:
+                if token in description:
+                    by_text[token].add(name)
+    
+    return ThreatIndex(
+        by_type=dict(by_type),
+        by_text=dict(by_text),
+        order={name: i for i, name in enumerate(threats)}
+    )
 
-def match_threats_to_component(component: Component, threats: Dict[str, Dict]) -> List[Dict]:
+def match_threats_to_component(component: Component, threats: Dict[str, Dict],
+                               threat_index: Optional[ThreatIndex] = None) -> List[Dict]:
     """Match and adjust threats based on enhanced component attributes"""
-    matched_threats = []
+    matches = []
+    risk_factors = calculate_component_risk_factors(component)
+    
+    # Lowercase the component attributes once rather than per threat
+    type_lower = component.type.value.lower()
+    interfaces_lower = [interface.lower() for interface in component.interfaces]
+    data_types_lower = [data_type.lower() for data_type in component.data_types]
+    
+    if threat_index is not None:
+        # Every candidate matched on type, interface or data type when indexed
+        candidates = set(threat_index.by_type.get(type_lower, ()))
+        for token in (*interfaces_lower, *data_types_lower):
+            candidates.update(threat_index.by_text.get(token, ()))
+        return _matched_threats(
+            [(name, threats[name]) for name in sorted(candidates, key=threat_index.order.__getitem__)],
+            component,
+            risk_factors
+        )
     
     for name, threat in threats.items():
+        description = threat.get('description', '').lower()
+        
         # Match based on component type and interfaces
-        type_match = component.type.value.lower() in name.lower()
-        interface_match = any(
-            interface.lower() in threat.get('description', '').lower()
-            for interface in component.interfaces
-        )
-        data_match = any(
-            data_type.lower() in threat.get('description', '').lower()
-            for data_type in component.data_types
-        )
+        type_match = type_lower in name.lower()
+        interface_match = any(interface in description for interface in interfaces_lower)
+        data_match = any(data_type in description for data_type in data_types_lower)
         
         if type_match or interface_match or data_match:
-            adjusted_threat = adjust_threat_scores(threat, component)
-            matched_threats.append({
-                'name': name,
-                **adjusted_threat
-            })
+            matches.append((name, threat))
     
-    return matched_threats
+    return _matched_threats(matches, component, risk_factors)
 
-def analyze_threats(components: Dict[str, Component]) -> Dict[str, Dict]:
+# STRIDE categories with their report keys, lowercased for recommendation filtering
+STRIDE_KEYS = tuple((category, str(category), str(category).lower()) for category in StrideCategory)
+
+def _analyze_component(component: Component, all_threats: Dict[str, Dict],
+                       threat_index: Optional[ThreatIndex]) -> Dict:
+    """Run the per-component threat, STRIDE, compliance and risk analysis"""
+    # Match threats to component
+    matched_threats = match_threats_to_component(component, all_threats, threat_index)
+    
+    interfaces = list(component.interfaces)
+    access_points = list(component.access_points)
+    
+    # Analyze STRIDE categories
+    stride_categories = analyze_stride_categories(
+        component.type.value,
+        interfaces,
+        access_points,
+        list(component.data_types),
+        component.trust_zone.value
+    )
+    
+    # Get security recommendations
+    recommendations = get_stride_recommendations(
+        stride_categories,
+        component.type.value,
+        component.safety_level.value
+    )
+    
+    recommendations_lower = [(r, r.lower()) for r in recommendations]
+    
+    # Map threats to compliance standards and format results
+    compliance_reqs = []
+    for threat in matched_threats:
+        reqs = map_threat_to_standards(
+            threat['name'],
+            component.safety_level.value,
+            component.trust_zone.value
+        )
+        compliance_reqs.extend(reqs)
+    
+    # Map threats to cybersecurity goals
+    goal_mappings = map_all_component_threats_to_goals({
+        'type': component.type.value,
+        'safety_level': component.safety_level.value,
+        'threats': matched_threats
+    })
+    
+    # Assess attacker feasibility for threats
+    feasibility_assessments = assess_all_component_threats({
+        'type': component.type.value,
+        'safety_level': component.safety_level.value,
+        'interfaces': interfaces,
+        'access_points': access_points,
+        'location': component.location,
+        'threats': matched_threats
+    })
+    
+    # Assess risk acceptance criteria
+    risk_acceptance_assessments = assess_component_risk_acceptance({
+        'type': component.type.value,
+        'safety_level': component.safety_level.value,
+        'threats': matched_threats
+    })
+    
+    return {
+        'name': component.name,
+        'type': component.type.value,
+        'safety_level': component.safety_level.value,
+        'interfaces': component.interfaces,
+        'access_points': component.access_points,
+        'data_types': component.data_types,
+        'location': component.location,
+        'trust_zone': component.trust_zone.value,
+        'connected_to': component.connected_to,
+        'threats': matched_threats,
+        'stride_analysis': {
+            key: {
+                'risk_level': 'High' if category in stride_categories else 'Low',
+                'recommendations': [r for r, r_lower in recommendations_lower if key_lower in r_lower]
+            }
+            for category, key, key_lower in STRIDE_KEYS
+        },
+        'compliance': compliance_reqs,
+        'cybersecurity_goals': goal_mappings,
+        'feasibility_assessments': feasibility_assessments,
+        'risk_acceptance': risk_acceptance_assessments
+    }
+
+# Threats and index shared with analysis worker processes by the pool initializer
+_worker_threats: Dict[str, Dict] = {}
+_worker_threat_index: Optional[ThreatIndex] = None
+
+def _init_analysis_worker(all_threats: Dict[str, Dict], threat_index: ThreatIndex) -> None:
+    global _worker_threats, _worker_threat_index
+    _worker_threats = all_threats
+    _worker_threat_index = threat_index
+
+def _analyze_component_in_worker(component: Component) -> Dict:
+    return _analyze_component(component, _worker_threats, _worker_threat_index)
+
+def analyze_threats(components: Dict[str, Component],
+                    max_workers: Optional[int] = None) -> Dict[str, Dict]:
     """
     Analyze threats for all components using STRIDE methodology
     Returns a dictionary mapping component IDs to their threats
+    
+    With max_workers > 1 the per-component analysis runs in a process pool.
     """
     # Load CAPEC threats
     print("Loading threats from CAPEC files...")
     capec_files = [Path('1000.csv'), Path('3000.csv')]
     try:
-        capec_threats = load_threats_from_capec(capec_files)
+        capec_threats = load_threats_from_capec_cached(capec_files)
         all_threats = {**AUTOMOTIVE_THREATS, **capec_threats}
     except Exception as e:
         print(f"Warning: Could not load CAPEC threats: {e}", file=sys.stderr)
         all_threats = AUTOMOTIVE_THREATS
     
-    analyzed_components = {}
+    threat_index = build_threat_index(list(components.values()), all_threats)
     
-    for comp_id, component in components.items():
-        # Match threats to component
-        matched_threats = match_threats_to_component(component, all_threats)
-        
-        # Analyze STRIDE categories
-        stride_categories = analyze_stride_categories(
-            component.type.value,
-            list(component.interfaces),
-            list(component.access_points),
-            list(component.data_types),
-            component.trust_zone.value
-        )
-        
-        # Get security recommendations
-        recommendations = get_stride_recommendations(
-            stride_categories,
-            component.type.value,
-            component.safety_level.value
-        )
-        
-        # Map threats to compliance standards and format results
-        compliance_reqs = []
-        for threat in matched_threats:
-            reqs = map_threat_to_standards(
-                threat['name'],
-                component.safety_level.value,
-                component.trust_zone.value
+    if max_workers is not None and max_workers > 1 and len(components) > 1:
+        # Threats and index are sent once per worker rather than per component
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_analysis_worker,
+                                 initargs=(all_threats, threat_index)) as pool:
+            results = pool.map(
+                _analyze_component_in_worker,
+                components.values(),
+                chunksize=max(1, len(components) // (max_workers * 4))
             )
-            compliance_reqs.extend(reqs)
-        
-        # Map threats to cybersecurity goals
-        goal_mappings = map_all_component_threats_to_goals({
-            'type': component.type.value,
-            'safety_level': component.safety_level.value,
-            'threats': matched_threats
-        })
-        
-        # Assess attacker feasibility for threats
-        feasibility_assessments = assess_all_component_threats({
-            'type': component.type.value,
-            'safety_level': component.safety_level.value,
-            'interfaces': list(component.interfaces),
-            'access_points': list(component.access_points),
-            'location': component.location,
-            'threats': matched_threats
-        })
-        
-        # Assess risk acceptance criteria
-        risk_acceptance_assessments = assess_component_risk_acceptance({
-            'type': component.type.value,
-            'safety_level': component.safety_level.value,
-            'threats': matched_threats
-        })
-        
-        # Store results
-        analyzed_components[comp_id] = {
-            'name': component.name,
-            'type': component.type.value,
-            'safety_level': component.safety_level.value,
-            'interfaces': list(component.interfaces),
-            'access_points': list(component.access_points),
-            'data_types': list(component.data_types),
-            'location': component.location,
-            'trust_zone': component.trust_zone.value,
-            'connected_to': list(component.connected_to),
-            'threats': matched_threats,
-            'stride_analysis': {
-                str(category): {
-                    'risk_level': 'High' if category in stride_categories else 'Low',
-                    'recommendations': [r for r in recommendations if str(category).lower() in r.lower()]
-                }
-                for category in StrideCategory
-            },
-            'compliance': compliance_reqs,
-            'cybersecurity_goals': goal_mappings,
-            'feasibility_assessments': feasibility_assessments,
-            'risk_acceptance': risk_acceptance_assessments
+            analyzed_components = dict(zip(components, results))
+    else:
+        analyzed_components = {
+            comp_id: _analyze_component(component, all_threats, threat_index)
+            for comp_id, component in components.items()
         }
     
     # Convert components dictionary to list for attack path analysis
     component_list = list(components.values())
+    by_zone = group_by_trust_zone(component_list)
     
     # Analyze attack paths between components
-    attack_paths = analyze_attack_paths(component_list, all_threats)
+    attack_paths = analyze_attack_paths(component_list, all_threats, by_zone)
     
     # Add attack paths to results
+    threat_matrix = build_threat_matrix(all_threats) if attack_paths else None
     for comp_id, paths in attack_paths.items():
         if comp_id in analyzed_components:
             analyzed_components[comp_id]['attack_paths'] = [
                 {
                     'path': path,
-                    'risk': calculate_chain_risk(path, all_threats)
+                    'risk': calculate_chain_risk(path, all_threats, threat_matrix)
                 }
                 for path in paths
             ]
     
     return analyzed_components
 
-def analyze_attack_paths(components: List[Component], threats: Dict[str, Dict]) -> Dict[str, List[List[str]]]:
+def group_by_trust_zone(components: Iterable[Component]) -> Dict[TrustZone, List[Component]]:
+    """Bucket components by trust zone in one pass"""
+    by_zone = defaultdict(list)
+    for component in components:
+        by_zone[component.trust_zone].append(component)
+    return by_zone
+
+def analyze_attack_paths(components: List[Component], threats: Dict[str, Dict],
+                         by_zone: Optional[Dict[TrustZone, List[Component]]] = None) -> Dict[str, List[List[str]]]:
     """Analyze potential attack paths through connected components"""
     paths = defaultdict(list)
-    
-    def find_paths(start: str, target: str, visited: Set[str], current_path: List[str]):
-        if len(current_path) > 5:  # Limit path length
-            return
-        
-        current = next((c for c in components if c.component_id == start), None)
-        if not current or start in visited:
-            return
-        
-        current_path.append(start)
-        visited.add(start)
-        
-        if start == target:
-            paths[start].append(current_path)
-            return
-        
-        for next_id in current.connected_to:
-            find_paths(next_id, target, visited.copy(), current_path.copy())
-    
+    if by_zone is None:
+        by_zone = group_by_trust_zone(components)
+
     # Find paths to critical components
-    critical_components = [c for c in components if c.trust_zone == TrustZone.CRITICAL]
-    untrusted_components = [c for c in components if c.trust_zone == TrustZone.UNTRUSTED]
-    
+    critical_components = by_zone.get(TrustZone.CRITICAL, [])
+    untrusted_components = by_zone.get(TrustZone.UNTRUSTED, [])
+    if not critical_components or not untrusted_components:
+        return paths
+
+    components_by_id = {c.component_id: c for c in components}
+    critical_ids = {c.component_id for c in critical_components}
+    adjacency = {
+        component_id: tuple(next_id for next_id in component.connected_to if next_id in components_by_id)
+        for component_id, component in components_by_id.items()
+    }
+
+    # One breadth-first sweep from every untrusted source at once; if no
+    # critical component is within reach there are no paths to enumerate
+    reached = {c.component_id for c in untrusted_components}
+    frontier = list(reached)
+    for _ in range(5):
+        frontier = [
+            next_id
+            for current_id in frontier
+            for next_id in adjacency[current_id]
+            if next_id not in reached
+        ]
+        reached.update(frontier)
+    if reached.isdisjoint(critical_ids):
+        return paths
+
+    def find_paths(start: str):
+        # Backtracking DFS from one source that records a path every time it
+        # reaches a critical component; one path list and visited set are
+        # shared by the whole walk and only copied when a path is recorded
+        current_path = [start]
+        visited = {start}
+        if start in critical_ids:
+            paths[start].append([start])
+        neighbours = [iter(adjacency[start])]
+        while neighbours:
+            next_id = next(neighbours[-1], None)
+            if next_id is None:
+                # All neighbours explored, step back
+                neighbours.pop()
+                visited.remove(current_path.pop())
+                continue
+            if next_id in visited:
+                continue
+
+            current_path.append(next_id)
+            visited.add(next_id)
+            if next_id in critical_ids:
+                paths[next_id].append(current_path[:])
+            if len(current_path) > 5:  # Limit path length
+                visited.remove(current_path.pop())
+                continue
+            neighbours.append(iter(adjacency[next_id]))
+
     for start in untrusted_components:
-        for target in critical_components:
-            find_paths(start.component_id, target.component_id, set(), [])
+        find_paths(start.component_id)
     
     return paths
 
-def calculate_chain_risk(chain: List[str], threats: Dict[str, Dict]) -> Dict[str, int]:
+CHAIN_IMPACT_CATEGORIES = ("financial", "safety", "privacy")
+
+@lru_cache(maxsize=4096)
+def _component_mention(comp_id: str) -> re.Pattern:
+    """Pattern for a component ID as a whole token in a lowercased threat name
+    
+    Case-insensitive by lowercasing the ID, and bounded so that ECU1 does not
+    match a threat about ECU10.
+    """
+    return re.compile(r'(?<![0-9a-z])' + re.escape(comp_id.lower()) + r'(?![0-9a-z])')
+
+@dataclass
+class ThreatMatrix:
+    """Threat names, impacts and likelihoods packed into arrays for chain scoring"""
+    names_lower: np.ndarray
+    impact: np.ndarray
+    likelihood: np.ndarray
+    component_rows: Dict[str, np.ndarray] = field(default_factory=dict)
+    
+    def rows_for(self, comp_id: str) -> np.ndarray:
+        """Indices of the threats whose name mentions a component, found once per component"""
+        rows = self.component_rows.get(comp_id)
+        if rows is None:
+            pattern = _component_mention(comp_id)
+            rows = np.flatnonzero([pattern.search(name) is not None for name in self.names_lower.tolist()])
+            self.component_rows[comp_id] = rows
+        return rows
+
+def build_threat_matrix(threats: Dict[str, Dict]) -> ThreatMatrix:
+    """Pack threats once so every attack chain can be scored with array operations"""
+    return ThreatMatrix(
+        names_lower=np.array([name.lower() for name in threats], dtype=str),
+        impact=np.array(
+            [[threat['impact'].get(category, 0) for category in CHAIN_IMPACT_CATEGORIES]
+             for threat in threats.values()]
+        ).reshape(-1, len(CHAIN_IMPACT_CATEGORIES)),
+        likelihood=np.array([threat['likelihood'] for threat in threats.values()])
+    )
+
+def calculate_chain_risk(chain: List[str], threats: Dict[str, Dict],
+                         threat_matrix: Optional[ThreatMatrix] = None) -> Dict[str, int]:
     """Calculate cumulative risk for an attack chain"""
+    if threat_matrix is not None:
+        # Threats whose name mentions any component on the chain
+        mask = np.zeros(len(threat_matrix.names_lower), dtype=bool)
+        for comp_id in chain:
+            mask[threat_matrix.rows_for(comp_id)] = True
+        
+        # Likelihood saturates at 5, so the running sum can be capped once
+        chain_impacts = threat_matrix.impact[mask].max(axis=0, initial=0)
+        chain_likelihood = min(5, 1 + threat_matrix.likelihood[mask].sum().item())
+        return {
+            category: min(5, int((impact.item() * chain_likelihood) / 3))
+            for category, impact in zip(CHAIN_IMPACT_CATEGORIES, chain_impacts)
+        }
+    
     # Base risk scores for chain analysis
     chain_impacts = {
         "financial": 0,
@@ -390,7 +747,7 @@ def calculate_chain_risk(chain: List[str], threats: Dict[str, Dict]) -> Dict[str
     # Analyze each step in the chain
     for threat_name in threats:
         threat = threats[threat_name]
-        if any(comp_id in threat_name.lower() for comp_id in chain):
+        if any(_component_mention(comp_id).search(threat_name.lower()) for comp_id in chain):
             # Update impacts - take maximum impact for each category
             for category, score in threat['impact'].items():
                 chain_impacts[category] = max(chain_impacts[category], score)
@@ -404,76 +761,69 @@ def calculate_chain_risk(chain: List[str], threats: Dict[str, Dict]) -> Dict[str
     
     return risk_scores
 
-def write_report(components: Dict[str, Component], analyzed_components: Dict[str, Dict], output_path: Path, format: str = 'txt') -> None:
-    """Generate and write risk report"""
+def _component_report(analysis: Dict) -> Dict:
+    """Serializable report entry for one analyzed component
+    
+    The entry reuses the component fields analyze_threats already stored;
+    goal mappings and assessments are converted to plain dicts in place.
+    Attack paths are left out of the report as before.
+    """
+    if 'cybersecurity_goals' in analysis:
+        analysis['cybersecurity_goals'] = {
+            threat_name: [
+                {
+                    'goal': mapping.goal.value,
+                    'relevance': mapping.relevance,
+                    'description': mapping.description,
+                    'requirements': mapping.requirements
+                } for mapping in mappings
+            ]
+            for threat_name, mappings in analysis['cybersecurity_goals'].items()
+        }
+    for key in ('feasibility_assessments', 'risk_acceptance'):
+        if key in analysis:
+            analysis[key] = {
+                threat_name: assessment.to_dict()
+                for threat_name, assessment in analysis[key].items()
+            }
+    
+    return {key: value for key, value in analysis.items() if key != 'attack_paths'}
+
+def write_report(components: Dict[str, Component], analyzed_components: Dict[str, Dict], output_path: Path,
+                 format: Union[str, Sequence[str]] = 'txt') -> None:
+    """Generate and write risk report
+    
+    Pass a list of formats to export several files from one prepared report.
+    """
     try:
+        # Convert components to serializable format, counting threats on the way
+        component_reports = {}
+        total_threats = 0
+        high_risk_threats = 0
+        for comp_id in components:
+            analysis = analyzed_components[comp_id]
+            total_threats += len(analysis['threats'])
+            high_risk_threats += sum(
+                1 for threat in analysis['threats']
+                if any(score >= 4 for score in threat.get('impact', {}).values())
+            )
+            component_reports[comp_id] = _component_report(analysis)
+        
         # Prepare structured report data
         report_data = {
-            'components': {},
+            'components': component_reports,
             'generated_at': datetime.now().isoformat(),
             'summary': {
                 'total_components': len(components),
-                'total_threats': sum(len(comp_data['threats']) for comp_data in analyzed_components.values()),
+                'total_threats': total_threats,
                 'critical_components': sum(1 for comp in components.values() if comp.trust_zone == TrustZone.CRITICAL),
-                'high_risk_threats': sum(
-                    1 for comp_data in analyzed_components.values()
-                    for threat in comp_data['threats']
-                    if any(score >= 4 for score in threat.get('impact', {}).values())
-                )
+                'high_risk_threats': high_risk_threats
             }
         }
         
-        # Convert components to serializable format
-        for comp_id, comp in components.items():
-            # Convert cybersecurity goals to serializable format
-            if comp_id in analyzed_components and 'cybersecurity_goals' in analyzed_components[comp_id]:
-                goals_dict = {}
-                for threat_name, mappings in analyzed_components[comp_id]['cybersecurity_goals'].items():
-                    goals_dict[threat_name] = [
-                        {
-                            'goal': mapping.goal.value,
-                            'relevance': mapping.relevance,
-                            'description': mapping.description,
-                            'requirements': mapping.requirements
-                        } for mapping in mappings
-                    ]
-                analyzed_components[comp_id]['cybersecurity_goals'] = goals_dict
-            
-            # Convert feasibility assessments to serializable format
-            if comp_id in analyzed_components and 'feasibility_assessments' in analyzed_components[comp_id]:
-                feasibility_dict = {}
-                for threat_name, assessment in analyzed_components[comp_id]['feasibility_assessments'].items():
-                    feasibility_dict[threat_name] = assessment.to_dict()
-                analyzed_components[comp_id]['feasibility_assessments'] = feasibility_dict
-            
-            # Convert risk acceptance assessments to serializable format
-            if comp_id in analyzed_components and 'risk_acceptance' in analyzed_components[comp_id]:
-                risk_acceptance_dict = {}
-                for threat_name, assessment in analyzed_components[comp_id]['risk_acceptance'].items():
-                    risk_acceptance_dict[threat_name] = assessment.to_dict()
-                analyzed_components[comp_id]['risk_acceptance'] = risk_acceptance_dict
-                
-            # Add component to report
-            report_data['components'][comp_id] = {
-                'name': comp.name,
-                'type': comp.type.value,
-                'safety_level': comp.safety_level.value,
-                'interfaces': list(comp.interfaces),
-                'access_points': list(comp.access_points),
-                'data_types': list(comp.data_types),
-                'location': comp.location,
-                'trust_zone': comp.trust_zone.value,
-                'connected_to': list(comp.connected_to),
-                'threats': analyzed_components[comp_id]['threats'],
-                'stride_analysis': analyzed_components[comp_id]['stride_analysis'],
-                'compliance': analyzed_components[comp_id]['compliance'],
-                'cybersecurity_goals': analyzed_components[comp_id].get('cybersecurity_goals', {}),
-                'feasibility_assessments': analyzed_components[comp_id].get('feasibility_assessments', {}),
-                'risk_acceptance': analyzed_components[comp_id].get('risk_acceptance', {})
-            }
-        
         # Export in different formats
-        export_report(report_data, output_path, format)
+        formats = [format] if isinstance(format, str) else format
+        export_report_multi(report_data, output_path, formats)
         
     except Exception as e:
         print(f"Error generating report: {e}", file=sys.stderr)
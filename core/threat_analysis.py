@@ -5,9 +5,15 @@ Handles CAPEC threat loading, impact analysis, and threat-component matching
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 import csv
+import json
+
+CAPEC_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "threat_catalogs" / ".capec_cache.json"
+# Bump whenever CAPEC parsing or impact scoring changes so stale caches are reparsed
+CAPEC_CACHE_VERSION = 1
 
 class ImpactCategory(Enum):
     FINANCIAL = "financial"
@@ -141,6 +147,53 @@ def load_threats_from_capec(capec_files: List[Path]) -> Dict[str, Dict]:
     
     return threats
 
+def _capec_cache_key(capec_files: List[Path]) -> Tuple[Optional[Tuple], ...]:
+    """Identify CAPEC files by path, modification time and size"""
+    key = []
+    for file in capec_files:
+        try:
+            stat = file.stat()
+        except OSError:
+            key.append(None)
+            continue
+        key.append((str(file.resolve()), stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+def load_threats_from_capec_cached(capec_files: List[Path],
+                                   cache_path: Path = CAPEC_CACHE_PATH) -> Dict[str, Dict]:
+    """Load CAPEC threats, reusing the parsed result while the files are unchanged
+    
+    Parsed threats are kept in memory for repeated analyses in one process
+    and on disk between runs. Treat the returned dict as read-only.
+    """
+    key = _capec_cache_key(capec_files)
+    if all(entry is None for entry in key):
+        return load_threats_from_capec(capec_files)
+    return _load_capec_for_key(tuple(capec_files), key, cache_path)
+
+@lru_cache(maxsize=4)
+def _load_capec_for_key(capec_files: Tuple[Path, ...], key: Tuple[Optional[Tuple], ...],
+                        cache_path: Path) -> Dict[str, Dict]:
+    """Load CAPEC threats through the on-disk cache for one file-state key"""
+    # JSON stores the key tuples as lists
+    stored_key = [list(entry) if entry is not None else None for entry in key]
+    try:
+        cached = json.loads(cache_path.read_text(encoding='utf-8'))
+        if cached.get('version') == CAPEC_CACHE_VERSION and cached.get('key') == stored_key:
+            return cached['threats']
+    except (OSError, ValueError, AttributeError):
+        pass
+    
+    threats = load_threats_from_capec(list(capec_files))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({'version': CAPEC_CACHE_VERSION, 'key': stored_key,
+                                          'threats': threats}), encoding='utf-8')
+    except OSError as e:
+        print(f"Warning: Could not write CAPEC cache to {cache_path}: {e}")
+    
+    return threats
+
 # Built-in automotive threat database
 AUTOMOTIVE_THREATS = {
     "CAN Injection": {
@@ -0,0 +1,348 @@
+"""Tests for `core.quicktara` — component loading, threat matching, attack paths."""
+from __future__ import annotations
+
+import json
+import pickle
+
+import pytest
+
+from core import export_formats, quicktara
+from core.quicktara import (
+    AssetType,
+    Component,
+    SafetyLevel,
+    TrustZone,
+    adjust_threat_scores,
+    analyze_attack_paths,
+    analyze_threats,
+    build_threat_index,
+    build_threat_matrix,
+    load_components,
+    calculate_chain_risk,
+    match_threats_to_component,
+    parse_component,
+    write_report,
+)
+from core.threat_analysis import AUTOMOTIVE_THREATS
+
+
+def _component(component_id: str, trust_zone: TrustZone, connected_to=(), **overrides) -> Component:
+    fields = dict(
+        component_id=component_id,
+        name=component_id,
+        type=AssetType.ECU,
+        safety_level=SafetyLevel.ASIL_B,
+        interfaces=("CAN",),
+        access_points=(),
+        data_types=(),
+        location="Internal",
+        trust_zone=trust_zone,
+        connected_to=tuple(connected_to),
+    )
+    fields.update(overrides)
+    return Component(**fields)
+
+
+# ──────────────── Component parsing ────────────────
+
+
+def test_parse_component_dedupes_multi_value_fields_in_order() -> None:
+    component = parse_component({
+        "component_id": " ECU1 ", "name": "Engine ECU", "type": "ecu",
+        "safety_level": "asil d", "interfaces": "CAN| Ethernet |CAN|",
+        "access_points": "", "data_types": "Telemetry", "location": "Internal",
+        "trust_zone": "critical", "connected_to": "GW|TCU",
+    })
+    assert component.component_id == "ECU1"
+    assert component.safety_level is SafetyLevel.ASIL_D
+    assert component.interfaces == ("CAN", "Ethernet")
+    assert component.access_points == ()
+    assert component.connected_to == ("GW", "TCU")
+
+
+def test_component_survives_pickling() -> None:
+    component = _component("GW", TrustZone.BOUNDARY, ["ECU"], interfaces=("CAN", "Ethernet"))
+    assert pickle.loads(pickle.dumps(component)) == component
+
+
+CSV_HEADER = "component_id,name,type,safety_level,interfaces,access_points,data_types,location,trust_zone,connected_to\n"
+
+
+def test_load_components_skips_blank_and_invalid_rows(tmp_path, capsys) -> None:
+    asset_file = tmp_path / "assets.csv"
+    asset_file.write_text(
+        CSV_HEADER
+        + "ECU1,Engine ECU,ECU,ASIL D,CAN,,Telemetry,Internal,Critical,GW1\n"
+        + "\n"
+        + "BAD1,Toaster,Toaster,QM,,,,Internal,Standard,\n"
+        + "SHORT1,Short row,ECU\n"
+        + "GW1,Gateway,Gateway,QM,CAN|Ethernet,OBD-II,,External,Boundary,ECU1\n"
+    )
+    components = load_components(asset_file)
+
+    assert list(components) == ["ECU1", "GW1"]
+    assert components["GW1"].interfaces == ("CAN", "Ethernet")
+    assert components["ECU1"].interfaces[0] is components["GW1"].interfaces[0]
+    warnings = capsys.readouterr().err
+    assert "Could not parse component Toaster" in warnings
+    assert "Could not parse component Short row" in warnings
+
+
+def test_load_components_accepts_trailing_commas(tmp_path, capsys) -> None:
+    asset_file = tmp_path / "assets.csv"
+    asset_file.write_text(
+        CSV_HEADER
+        + "C1,A,ECU,QM,CAN,OBD,Diag,Internal,Critical,C2,\n"
+        + "C2,B,Gateway,ASIL B,CAN|Ethernet,,,External,Untrusted,C1,\n"
+    )
+    components = load_components(asset_file)
+
+    assert list(components) == ["C1", "C2"]
+    assert components["C1"].type is AssetType.ECU
+    assert components["C1"].connected_to == ("C2",)
+    assert components["C2"].interfaces == ("CAN", "Ethernet")
+    assert capsys.readouterr().err == ""
+
+
+def test_load_components_rejects_missing_columns(tmp_path) -> None:
+    asset_file = tmp_path / "assets.csv"
+    asset_file.write_text("component_id,name\nECU1,Engine ECU\n")
+    with pytest.raises(ValueError, match="Missing required columns: type"):
+        load_components(asset_file)
+
+
+# ──────────────── Threat matching ────────────────
+
+
+def test_match_threats_by_type_interface_and_data_type() -> None:
+    component = _component("GW", TrustZone.BOUNDARY, type=AssetType.GATEWAY, data_types=("Sensor Data",))
+    names = [t["name"] for t in match_threats_to_component(component, AUTOMOTIVE_THREATS)]
+    # "CAN" matches the CAN Injection description, "sensor data" the sensor
+    # manipulation one, and the type matches the gateway threat by name.
+    assert names == ["CAN Injection", "Sensor Data Manipulation", "Gateway Compromise"]
+
+
+def test_indexed_matching_equals_linear_scan() -> None:
+    components = [
+        _component("ECU", TrustZone.CRITICAL),
+        _component("GW", TrustZone.BOUNDARY, type=AssetType.GATEWAY, interfaces=("Ethernet", "network")),
+        _component("SNS", TrustZone.STANDARD, type=AssetType.SENSOR, interfaces=(),
+                   data_types=("Diagnostic",)),
+    ]
+    index = build_threat_index(components, AUTOMOTIVE_THREATS)
+
+    for component in components:
+        assert match_threats_to_component(component, AUTOMOTIVE_THREATS, index) == \
+            match_threats_to_component(component, AUTOMOTIVE_THREATS)
+
+
+def test_aho_corasick_index_equals_substring_scan(monkeypatch) -> None:
+    pytest.importorskip("ahocorasick")
+    components = [
+        _component("GW", TrustZone.BOUNDARY, interfaces=("CAN", "Ethernet", "OBD-II", "an"),
+                   data_types=("Sensor Data", "Diagnostic")),
+    ]
+    monkeypatch.setattr(quicktara, "AHOCORASICK_MIN_TOKENS", 1)
+    indexed = build_threat_index(components, AUTOMOTIVE_THREATS)
+
+    monkeypatch.setattr(quicktara, "HAS_AHOCORASICK", False)
+    assert indexed == build_threat_index(components, AUTOMOTIVE_THREATS)
+    assert indexed.by_text["an"]  # overlapping and nested tokens still match
+
+
+def test_batch_scoring_matches_per_threat_adjustment() -> None:
+    component = _component("ECU", TrustZone.UNTRUSTED, safety_level=SafetyLevel.ASIL_D, location="External")
+    threats = {
+        f"CAN threat {i}": {
+            "description": "CAN bus attack",
+            "likelihood": 1 + i % 5,
+            "impact": {"financial": 1 + i % 5, "safety": 5 - i % 5, "privacy": 3},
+        }
+        for i in range(12)
+    }
+    matched = match_threats_to_component(component, threats)
+
+    assert len(matched) == len(threats)
+    for entry in matched:
+        expected = {"name": entry["name"], **adjust_threat_scores(threats[entry["name"]], component)}
+        # Clipped scores stay ints (5, not 5.0) as min/max return them
+        assert repr(entry) == repr(expected)
+
+
+# ──────────────── Attack paths ────────────────
+
+
+def test_attack_paths_found_from_untrusted_to_critical() -> None:
+    components = [
+        _component("TCU", TrustZone.UNTRUSTED, ["GW"]),
+        _component("GW", TrustZone.BOUNDARY, ["ECU"]),
+        _component("ECU", TrustZone.CRITICAL),
+    ]
+    paths = analyze_attack_paths(components, {})
+    assert paths["ECU"] == [["TCU", "GW", "ECU"]]
+
+
+def test_attack_paths_enumerate_every_simple_path() -> None:
+    components = [
+        _component("TCU", TrustZone.UNTRUSTED, ["GW", "ECU"]),
+        _component("GW", TrustZone.BOUNDARY, ["ECU", "TCU"]),
+        _component("ECU", TrustZone.CRITICAL),
+    ]
+    paths = analyze_attack_paths(components, {})
+    assert sorted(paths["ECU"]) == [["TCU", "ECU"], ["TCU", "GW", "ECU"]]
+
+
+def test_attack_paths_continue_through_critical_components() -> None:
+    components = [
+        _component("TCU", TrustZone.UNTRUSTED, ["BMS"]),
+        _component("BMS", TrustZone.CRITICAL, ["ECU"]),
+        _component("ECU", TrustZone.CRITICAL),
+    ]
+    paths = analyze_attack_paths(components, {})
+    assert paths["BMS"] == [["TCU", "BMS"]]
+    assert paths["ECU"] == [["TCU", "BMS", "ECU"]]
+
+
+def test_attack_paths_skip_unknown_neighbours() -> None:
+    components = [
+        _component("TCU", TrustZone.UNTRUSTED, ["MISSING", "ECU"]),
+        _component("ECU", TrustZone.CRITICAL),
+    ]
+    paths = analyze_attack_paths(components, {})
+    assert paths["ECU"] == [["TCU", "ECU"]]
+
+
+def test_attack_paths_limited_to_six_hops() -> None:
+    ids = [f"N{i}" for i in range(8)]
+    components = [_component(ids[0], TrustZone.UNTRUSTED, [ids[1]])]
+    components += [_component(ids[i], TrustZone.STANDARD, [ids[i + 1]]) for i in range(1, 7)]
+    components.append(_component(ids[7], TrustZone.CRITICAL))
+    assert analyze_attack_paths(components, {}) == {}
+
+    components[5] = _component(ids[5], TrustZone.CRITICAL)
+    assert analyze_attack_paths(components, {})["N5"] == [ids[:6]]
+
+
+def test_attack_paths_empty_without_untrusted_components() -> None:
+    components = [
+        _component("GW", TrustZone.BOUNDARY, ["ECU"]),
+        _component("ECU", TrustZone.CRITICAL),
+    ]
+    assert analyze_attack_paths(components, {}) == {}
+
+
+# ──────────────── Chain risk ────────────────
+
+
+CHAIN_THREATS = {
+    "tcu spoofing": {"impact": {"financial": 2, "safety": 1, "privacy": 4}, "likelihood": 2},
+    "gw bypass": {"impact": {"financial": 3, "safety": 4, "privacy": 1}, "likelihood": 1},
+    "unrelated": {"impact": {"financial": 5, "safety": 5, "privacy": 5}, "likelihood": 4},
+}
+
+
+def test_chain_risk_uses_threats_named_after_chain_components() -> None:
+    risk = calculate_chain_risk(["tcu", "gw"], CHAIN_THREATS)
+    # max impacts (3, 4, 4) scaled by likelihood 1 + 2 + 1 = 4
+    assert risk == {"financial": 4, "safety": 5, "privacy": 5}
+
+
+def test_chain_risk_matches_component_ids_case_insensitively() -> None:
+    matrix = build_threat_matrix(CHAIN_THREATS)
+    expected = calculate_chain_risk(["tcu", "gw"], CHAIN_THREATS)
+    assert calculate_chain_risk(["TCU", "GW"], CHAIN_THREATS) == expected
+    assert calculate_chain_risk(["TCU", "GW"], CHAIN_THREATS, matrix) == expected
+
+
+def test_chain_risk_matches_whole_component_ids_only() -> None:
+    threats = {
+        "ECU10 Flash Attack": {"impact": {"financial": 5, "safety": 5, "privacy": 5}, "likelihood": 4},
+        "ECU1 Debug Access": {"impact": {"financial": 1, "safety": 2, "privacy": 1}, "likelihood": 2},
+    }
+    matrix = build_threat_matrix(threats)
+    # only ECU1 Debug Access: impacts (1, 2, 1) scaled by likelihood 1 + 2 = 3
+    expected = {"financial": 1, "safety": 2, "privacy": 1}
+    assert calculate_chain_risk(["ECU1"], threats) == expected
+    assert calculate_chain_risk(["ECU1"], threats, matrix) == expected
+
+
+def test_chain_risk_matrix_matches_dict_scan() -> None:
+    matrix = build_threat_matrix(CHAIN_THREATS)
+    for chain in (["tcu"], ["gw", "ecu"], ["ecu"], ["tcu", "gw", "unrelated"]):
+        assert calculate_chain_risk(chain, CHAIN_THREATS, matrix) == \
+            calculate_chain_risk(chain, CHAIN_THREATS)
+
+    # Fractional impacts are multiplied before rounding down on both paths
+    threats = {"ECU Glitch": {"impact": {"financial": 4.5, "safety": 0, "privacy": 0},
+                              "likelihood": 1}}
+    assert calculate_chain_risk(["ecu"], threats, build_threat_matrix(threats)) == \
+        calculate_chain_risk(["ecu"], threats) == {"financial": 3, "safety": 0, "privacy": 0}
+
+
+# ──────────────── Threat analysis ────────────────
+
+
+def test_analyze_threats_in_worker_processes_matches_serial(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)  # no CAPEC files here; built-in threats only
+    components = {
+        c.component_id: c
+        for c in (
+            _component("TCU", TrustZone.UNTRUSTED, ["GW"], type=AssetType.GATEWAY),
+            _component("GW", TrustZone.BOUNDARY, ["ECU"], interfaces=("CAN", "Ethernet")),
+            _component("ECU", TrustZone.CRITICAL, data_types=("Sensor Data",)),
+        )
+    }
+    serial = analyze_threats(components)
+    parallel = analyze_threats(components, max_workers=2)
+
+    assert list(parallel) == list(serial)
+    assert repr(parallel) == repr(serial)
+
+
+# ──────────────── Report ────────────────
+
+
+def test_write_report_exports_several_formats_from_one_pass(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)  # no CAPEC files here; built-in threats only
+    components = {
+        c.component_id: c
+        for c in (
+            _component("TCU", TrustZone.UNTRUSTED, ["ECU"], type=AssetType.GATEWAY),
+            _component("ECU", TrustZone.CRITICAL),
+        )
+    }
+    analyzed = analyze_threats(components)
+
+    write_report(components, analyzed, tmp_path / "report", ["txt", "xlsx", "txt"])
+
+    assert (tmp_path / "report.xlsx").exists()
+    text = (tmp_path / "report.txt").read_text()
+    assert "Total Components: 2" in text
+    assert "ECU Firmware Tampering" in text
+
+
+def _json_report(tmp_path, name: str) -> dict:
+    components = {
+        c.component_id: c
+        for c in (
+            _component("TCU", TrustZone.UNTRUSTED, ["ECU"], type=AssetType.GATEWAY),
+            _component("ECU", TrustZone.CRITICAL),
+        )
+    }
+    write_report(components, analyze_threats(components), tmp_path / name, "json")
+    report = json.loads((tmp_path / f"{name}.json").read_text(encoding="utf-8"))
+    del report["generated_at"]
+    return report
+
+
+def test_json_export_same_with_and_without_orjson(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)  # no CAPEC files here; built-in threats only
+    monkeypatch.setattr(export_formats, "HAS_ORJSON", False)
+    stdlib_report = _json_report(tmp_path, "stdlib")
+
+    compliance = stdlib_report["components"]["ECU"]["compliance"]
+    assert compliance and set(compliance[0]) == {"standard", "requirement", "description"}
+
+    pytest.importorskip("orjson")
+    monkeypatch.setattr(export_formats, "HAS_ORJSON", True)
+    assert _json_report(tmp_path, "orjson") == stdlib_report
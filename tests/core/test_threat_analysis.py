@@ -0,0 +1,76 @@
+"""Tests for `core.threat_analysis` — CAPEC loading and caching."""
+from __future__ import annotations
+
+import json
+import os
+
+from core import threat_analysis
+from core.threat_analysis import load_threats_from_capec_cached
+
+CAPEC_HEADER = "ID,Name,Description,Likelihood Of Attack,Typical Severity,Mitigations,Related Attack Patterns\n"
+
+
+def _write_capec(path, name: str) -> None:
+    path.write_text(CAPEC_HEADER + f"1,{name},Brake command spoofing,High,Very High,Auth,\n")
+
+
+def test_capec_cache_reused_until_file_changes(tmp_path, monkeypatch) -> None:
+    capec_file = tmp_path / "1000.csv"
+    cache_path = tmp_path / "cache" / "capec.json"
+    _write_capec(capec_file, "Spoof Brake")
+
+    first = load_threats_from_capec_cached([capec_file], cache_path)
+    assert list(first) == ["Spoof Brake"]
+    assert cache_path.exists()
+
+    parses = []
+    original = threat_analysis.load_threats_from_capec
+    monkeypatch.setattr(threat_analysis, "load_threats_from_capec",
+                        lambda files: parses.append(files) or original(files))
+
+    # Drop the in-memory layer so the lookup has to go through the file
+    threat_analysis._load_capec_for_key.cache_clear()
+    assert load_threats_from_capec_cached([capec_file], cache_path) == first
+    assert parses == []
+
+    _write_capec(capec_file, "Spoof Brakes")
+    stat = capec_file.stat()
+    os.utime(capec_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert list(load_threats_from_capec_cached([capec_file], cache_path)) == ["Spoof Brakes"]
+    assert len(parses) == 1
+
+
+def test_capec_cache_reparsed_after_version_change(tmp_path, monkeypatch) -> None:
+    capec_file = tmp_path / "1000.csv"
+    cache_path = tmp_path / "capec.json"
+    _write_capec(capec_file, "Spoof Brake")
+    load_threats_from_capec_cached([capec_file], cache_path)
+
+    parses = []
+    original = threat_analysis.load_threats_from_capec
+    monkeypatch.setattr(threat_analysis, "load_threats_from_capec",
+                        lambda files: parses.append(files) or original(files))
+    monkeypatch.setattr(threat_analysis, "CAPEC_CACHE_VERSION",
+                        threat_analysis.CAPEC_CACHE_VERSION + 1)
+
+    threat_analysis._load_capec_for_key.cache_clear()
+    assert list(load_threats_from_capec_cached([capec_file], cache_path)) == ["Spoof Brake"]
+    assert len(parses) == 1
+    assert json.loads(cache_path.read_text())["version"] == threat_analysis.CAPEC_CACHE_VERSION
+
+
+def test_capec_cache_not_written_without_files(tmp_path) -> None:
+    cache_path = tmp_path / "capec.json"
+    assert load_threats_from_capec_cached([tmp_path / "missing.csv"], cache_path) == {}
+    assert not cache_path.exists()
+
+
+def test_capec_threats_kept_in_memory_between_analyses(tmp_path) -> None:
+    capec_file = tmp_path / "1000.csv"
+    cache_path = tmp_path / "capec.json"
+    _write_capec(capec_file, "Spoof Brake")
+
+    first = load_threats_from_capec_cached([capec_file], cache_path)
+    cache_path.unlink()
+    assert load_threats_from_capec_cached([capec_file], cache_path) is first
+    assert not cache_path.exists()